@@ -2,11 +2,14 @@ import kopf
 import kubernetes
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
-import psycopg2
+import urllib3
 import os
-import tempfile
-import base64
+import asyncio
+import functools
+import json
 import uuid
+import time
+from pathlib import PurePosixPath
 
 # Load Kubernetes config
 try:
@@ -14,109 +17,475 @@ try:
 except config.ConfigException:
     config.load_kube_config()
 
-# Kubernetes API clients
-v1 = client.CoreV1Api()
-storage_v1 = client.StorageV1Api()
-custom_api = client.CustomObjectsApi()
-batch_v1 = client.BatchV1Api()
+# Kubernetes API clients, sharing one ApiClient whose connection pool is
+# large enough that concurrent handlers do not queue on it. Connections are
+# kept alive by urllib3; transient connect and read failures are retried
+# with a short backoff (urllib3 only retries reads of idempotent methods).
+configuration = client.Configuration.get_default_copy()
+configuration.connection_pool_maxsize = int(os.getenv('KUBE_CONNECTION_POOL_MAXSIZE', '50'))
+configuration.retries = urllib3.Retry(total=3, backoff_factor=0.2)
+client.Configuration.set_default(configuration)
+api_client = client.ApiClient(configuration)
+v1 = client.CoreV1Api(api_client)
+storage_v1 = client.StorageV1Api(api_client)
+custom_api = client.CustomObjectsApi(api_client)
+batch_v1 = client.BatchV1Api(api_client)
+
+PROVISIONER = 'k8s.insiderscore.com/pg-reflinker'
 
 # Environment variables
-HOSTPATH_PREFIX = os.getenv('HOSTPATH_PREFIX', '/var/lib/pg-reflinker')
-
-def get_cnpg_pod(cluster_name, namespace):
-    """Get the CNPG pod for a cluster in a namespace."""
-    pods = v1.list_namespaced_pod(namespace, label_selector=f'cnpg.io/cluster={cluster_name}')
-    if not pods.items:
-        raise kopf.TemporaryError(f"No pods found for cluster {cluster_name} in namespace {namespace}", delay=30)
-    return pods.items[0]
-
-def get_db_secrets(cluster_name, namespace):
-    """Get the replication and CA secrets for a cluster."""
-    replication_secret_name = f'{cluster_name}-replication'
-    ca_secret_name = f'{cluster_name}-ca'
-    replication_secret = v1.read_namespaced_secret(replication_secret_name, namespace)
-    ca_secret = v1.read_namespaced_secret(ca_secret_name, namespace)
-    return replication_secret, ca_secret
-
-def create_temp_certs(replication_secret, ca_secret):
-    """Create temporary certificate files and return their paths."""
-    client_cert_path = None
-    client_key_path = None
-    ca_cert_path = None
-    try:
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.crt') as client_cert_file:
-            client_cert_file.write(base64.b64decode(replication_secret.data['tls.crt']).decode('utf-8'))
-            client_cert_path = client_cert_file.name
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.key') as client_key_file:
-            client_key_file.write(base64.b64decode(replication_secret.data['tls.key']).decode('utf-8'))
-            client_key_path = client_key_file.name
-        
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.crt') as ca_cert_file:
-            ca_cert_file.write(base64.b64decode(ca_secret.data['ca.crt']).decode('utf-8'))
-            ca_cert_path = ca_cert_file.name
-        
-        return client_cert_path, client_key_path, ca_cert_path
-    except Exception:
-        # Clean up on failure
-        for path in [client_cert_path, client_key_path, ca_cert_path]:
-            if path and os.path.exists(path):
-                os.unlink(path)
-        raise
+# A path on the nodes, so always POSIX regardless of where the operator runs
+HOSTPATH_PREFIX = PurePosixPath(os.getenv('HOSTPATH_PREFIX', '/var/lib/pg-reflinker'))
+
+# StorageClasses fetched directly on an index miss, as name -> (expiry, value)
+STORAGE_CLASS_TTL = 300
+_storage_class_cache = {}
+
+class TokenBucket:
+    """Token-bucket rate limiter for coroutines on a single event loop."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+# Bound PV creation so a burst of PVCs does not trip apiserver throttling
+PV_CREATE_RATE = float(os.getenv('PV_CREATE_RATE', '10'))
+PV_CREATE_BURST = int(os.getenv('PV_CREATE_BURST', '20'))
+# A zero rate would divide by zero once the burst is spent, and a burst
+# below one token would make every create wait forever
+if not PV_CREATE_RATE > 0:
+    raise ValueError(f"PV_CREATE_RATE must be greater than 0, got {PV_CREATE_RATE}")
+if PV_CREATE_BURST < 1:
+    raise ValueError(f"PV_CREATE_BURST must be at least 1, got {PV_CREATE_BURST}")
+pv_create_limiter = TokenBucket(rate=PV_CREATE_RATE, burst=PV_CREATE_BURST)
+
+# In-memory indices maintained by kopf from its own watch streams, so the
+# hot path resolves objects without a GET against the apiserver.
+def summarize_pvc(body):
+    """Reduce a PVC body to the fields the handlers use."""
+    metadata = body.get('metadata', {})
+    return {
+        'uid': metadata.get('uid'),
+        'phase': body.get('status', {}).get('phase'),
+        'volume_name': body.get('spec', {}).get('volumeName'),
+        'owner_references': list(metadata.get('ownerReferences', [])),
+    }
+
+@kopf.index('persistentvolumeclaim')
+def pvc_index(namespace, name, body, **kwargs):
+    """Index PVCs by (namespace, name)."""
+    return {(namespace, name): summarize_pvc(body)}
+
+@kopf.index('persistentvolumeclaim')
+def pvc_name_index(namespace, name, **kwargs):
+    """Index PVC namespaces by PVC name, for dataSourceRefs without a namespace."""
+    return {name: namespace}
+
+@kopf.index('postgresql.cnpg.io', 'v1', 'clusters')
+def cluster_index(namespace, name, spec, **kwargs):
+    """Index CNPG Clusters by (namespace, name)."""
+    return {(namespace, name): {'image_name': spec.get('imageName')}}
+
+def summarize_pod(body):
+    """Reduce a pod body to the fields the handlers use."""
+    return {
+        'node_name': body.get('spec', {}).get('nodeName'),
+        'pod_ip': body.get('status', {}).get('podIP'),
+    }
+
+@kopf.index('pod', labels={'cnpg.io/cluster': kopf.PRESENT, 'cnpg.io/instanceRole': 'primary'},
+            when=lambda status, **_: status.get('phase') == 'Running')
+def pod_index(namespace, labels, body, **kwargs):
+    """Index running CNPG primary pods by (namespace, cluster).
+
+    Pods that are demoted or stop running no longer match the filters, and
+    kopf drops them from the index.
+    """
+    return {(namespace, labels['cnpg.io/cluster']): summarize_pod(body)}
+
+@kopf.index('secret', labels={'app.kubernetes.io/managed-by': 'cloudnative-pg'},
+            when=lambda name, **_: name.endswith(('-replication', '-ca')))
+def secret_index(namespace, name, **kwargs):
+    """Record which CNPG-managed secrets exist, by (namespace, name).
 
-def connect_to_db(db_host, db_port, db_user, db_name, client_cert_path, client_key_path, ca_cert_path):
-    """Connect to PostgreSQL with TLS certificate authentication."""
-    return psycopg2.connect(
-        host=db_host,
-        port=db_port,
-        user=db_user,
-        dbname=db_name,
-        sslmode='verify-ca',
-        sslcert=client_cert_path,
-        sslkey=client_key_path,
-        sslrootcert=ca_cert_path
+    Only existence is checked, so no secret data is kept in memory.
+    """
+    return {(namespace, name): True}
+
+def summarize_storage_class(body):
+    """Reduce a StorageClass body to the fields the handlers use."""
+    return {
+        'provisioner': body.get('provisioner'),
+        'reclaim_policy': body.get('reclaimPolicy'),
+    }
+
+@kopf.index('storage.k8s.io', 'v1', 'storageclasses')
+def storage_class_index(name, body, **kwargs):
+    """Index StorageClasses by name."""
+    return {name: summarize_storage_class(body)}
+
+@kopf.on.event('storage.k8s.io', 'v1', 'storageclasses')
+def evict_storage_class(type, name, **kwargs):
+    """Drop a directly-fetched StorageClass once the watch reports a change."""
+    if type in ('MODIFIED', 'DELETED'):
+        _storage_class_cache.pop(name, None)
+
+def _first(index, key):
+    """Return one indexed value for key, or None if the index has none."""
+    for value in index.get(key, []):
+        return value
+    return None
+
+def read_storage_class(name):
+    """Read a StorageClass missing from the index, through a TTL cache."""
+    cached = _storage_class_cache.get(name)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+    response = storage_v1.read_storage_class(name, _preload_content=False)
+    storage_class = summarize_storage_class(json.loads(response.data))
+    _storage_class_cache[name] = (time.monotonic() + STORAGE_CLASS_TTL, storage_class)
+    return storage_class
+
+def read_pvc(name, namespace):
+    """Read a PVC missing from the index, summarized like an index entry."""
+    response = v1.read_namespaced_persistent_volume_claim(name, namespace, _preload_content=False)
+    return summarize_pvc(json.loads(response.data))
+
+def find_pvc(name, candidate_namespaces):
+    """Find a PVC missing from the index in the first candidate namespace holding it.
+
+    Returns (namespace, summary), or (None, None) if no candidate has it.
+    """
+    # One cache-served list across all namespaces, instead of a GET per candidate
+    response = v1.list_persistent_volume_claim_for_all_namespaces(
+        field_selector=f'metadata.name={name}',
+        resource_version='0',
+        _preload_content=False,
     )
+    found = {item['metadata']['namespace']: item for item in json.loads(response.data).get('items', [])}
+    for ns in candidate_namespaces:
+        if ns in found:
+            return ns, summarize_pvc(found[ns])
+    return None, None
+
+def read_cnpg_pod(cluster_name, namespace):
+    """Read the running CNPG primary pod missing from the index."""
+    # resourceVersion=0 lets the apiserver answer from its watch cache
+    # instead of etcd, and any one running primary will do.
+    response = v1.list_namespaced_pod(
+        namespace,
+        label_selector=f'cnpg.io/cluster={cluster_name},cnpg.io/instanceRole=primary',
+        field_selector='status.phase=Running',
+        limit=1,
+        resource_version='0',
+        resource_version_match='NotOlderThan',
+        _preload_content=False,
+    )
+    items = json.loads(response.data).get('items', [])
+    if not items:
+        # Both lookups are cheap, so retry soon to ride out a failover
+        raise kopf.TemporaryError(f"No running primary pod found for cluster {cluster_name} in namespace {namespace}", delay=5)
+    return summarize_pod(items[0])
+
+def call_discarding(method, *args):
+    """Call an API method whose response is unused.
 
-def get_db_connection(cluster_name, namespace):
-    """Get a database connection for a CNPG cluster."""
-    pod = get_cnpg_pod(cluster_name, namespace)
-    replication_secret, ca_secret = get_db_secrets(cluster_name, namespace)
-    client_cert_path, client_key_path, ca_cert_path = create_temp_certs(replication_secret, ca_secret)
-    
+    The response is read raw rather than deserialized into a model, and its
+    connection is returned to the pool.
+    """
+    response = method(*args, _preload_content=False)
+    response.read()
+    response.release_conn()
+
+def create_if_absent(create, *args):
+    """Call a create_* API method, treating 409 Conflict as already created.
+
+    Kopf retries a failed handler from the top, and every object we create is
+    named after the backup label, so a retry must not redo what the previous
+    attempt already finished.
+    """
     try:
-        conn = connect_to_db(pod.status.pod_ip, 5432, 'streaming_replica', 'postgres', client_cert_path, client_key_path, ca_cert_path)
-        # Clean up cert files immediately after successful connection
-        # psycopg2 loads certificates into memory during connection
-        for path in [client_cert_path, client_key_path, ca_cert_path]:
-            if path and os.path.exists(path):
-                os.unlink(path)
-        return conn
-    except Exception:
-        # Clean up certs on connection failure
-        for path in [client_cert_path, client_key_path, ca_cert_path]:
-            if path and os.path.exists(path):
-                os.unlink(path)
+        call_discarding(create, *args)
+    except ApiException as e:
+        if e.status != 409:
+            raise
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking call in the default executor, off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(fn, *args, **kwargs))
+
+# Failed PVs are deleted from a queue rather than from the handlers, so a
+# burst of failures issues one DELETE per PV with bounded concurrency. A
+# name stays in _pv_deletes_pending from enqueue until its DELETE is done.
+PV_DELETE_CONCURRENCY = 4
+PV_DELETE_RETRY_DELAY = 10
+_pv_delete_queue = None
+_pv_deletes_pending = set()
+_pv_delete_tasks = set()
+# Timer handles of failed deletes waiting to be requeued, by PV name
+_pv_delete_retries = {}
+
+def enqueue_pv_delete(name, logger):
+    """Queue a PV for deletion unless it is already queued or in flight."""
+    if name in _pv_deletes_pending:
+        logger.info(f"PersistentVolume {name} is already queued for deletion.")
+        return
+    _pv_deletes_pending.add(name)
+    _pv_delete_queue.put_nowait(name)
+
+def requeue_pv_delete(name):
+    """Put a PV whose delete failed back on the queue."""
+    del _pv_delete_retries[name]
+    _pv_delete_queue.put_nowait(name)
+
+async def process_pv_delete(name, logger):
+    """Delete one queued PV, requeueing it after a delay on failure."""
+    try:
+        await run_blocking(call_discarding, v1.delete_persistent_volume, name)
+        logger.info(f"Deleted PersistentVolume {name}.")
+    except Exception as e:
+        # Transport errors, such as urllib3 running out of retries, are
+        # retried like API errors; only a 404 means there is nothing to do
+        if not (isinstance(e, ApiException) and e.status == 404):
+            logger.error(f"Failed to delete PersistentVolume {name}, retrying in {PV_DELETE_RETRY_DELAY}s: {e}")
+            _pv_delete_retries[name] = asyncio.get_running_loop().call_later(
+                PV_DELETE_RETRY_DELAY, requeue_pv_delete, name)
+            return
+        logger.info(f"PersistentVolume {name} already deleted.")
+    _pv_deletes_pending.discard(name)
+
+async def drain_pv_deletes(logger):
+    """Issue queued PV deletes, at most PV_DELETE_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(PV_DELETE_CONCURRENCY)
+    while True:
+        name = await _pv_delete_queue.get()
+        await semaphore.acquire()
+        task = asyncio.create_task(process_pv_delete(name, logger))
+        _pv_delete_tasks.add(task)
+        task.add_done_callback(_pv_delete_tasks.discard)
+        task.add_done_callback(lambda _: semaphore.release())
+
+async def get_postgres_image(cluster_name, namespace, cluster_index):
+    """Get the PostgreSQL image from the CNPG cluster spec."""
+    cluster = _first(cluster_index, (namespace, cluster_name))
+    if cluster is not None:
+        postgres_image = cluster['image_name']
+    else:
+        try:
+            cluster = await run_blocking(custom_api.get_namespaced_custom_object, 'postgresql.cnpg.io', 'v1', namespace, 'clusters', cluster_name)
+            postgres_image = cluster.get('spec', {}).get('imageName')
+        except ApiException as e:
+            raise kopf.PermanentError(f"Failed to get cluster {cluster_name}: {e}")
+    return postgres_image or 'postgres:16'  # default fallback
+
+async def get_node_affinity(volume_name):
+    """Get the node affinity of the source PVC's bound PV, if any."""
+    if not volume_name:
+        return None
+    try:
+        response = await run_blocking(v1.read_persistent_volume, volume_name, _preload_content=False)
+    except ApiException:
+        return None  # Node affinity is optional
+    return json.loads(response.data).get('spec', {}).get('nodeAffinity')
+
+async def check_db_secrets(cluster_name, namespace, secret_index):
+    """Ensure the secrets the populator Job mounts exist."""
+    # Secrets supplied by the user rather than generated by CNPG lack the
+    # label the index filters on; read those directly, overlapping the GETs.
+    missing = [
+        secret_name for secret_name in (f'{cluster_name}-replication', f'{cluster_name}-ca')
+        if _first(secret_index, (namespace, secret_name)) is None
+    ]
+    try:
+        await asyncio.gather(*(
+            run_blocking(call_discarding, v1.read_namespaced_secret, secret_name, namespace)
+            for secret_name in missing
+        ))
+    except Exception as e:
+        raise kopf.TemporaryError(f"Failed to get secrets: {e}", delay=30)
+
+async def find_cnpg_pod(cluster_name, namespace, pod_index):
+    """Get the running CNPG primary pod, reading off the loop only on an index miss."""
+    pod = _first(pod_index, (namespace, cluster_name))
+    if pod is not None:
+        return pod
+    try:
+        return await run_blocking(read_cnpg_pod, cluster_name, namespace)
+    except kopf.TemporaryError:
         raise
+    except Exception as e:
+        raise kopf.TemporaryError(f"Failed to get pod: {e}", delay=30)
+
+def is_reflinker_claim(spec, storage_class_index, **kwargs):
+    """Filter out PVCs whose StorageClass is indexed with another provisioner.
 
-@kopf.on.create('persistentvolumeclaim')
-def handle_pvc_create(spec, meta, name, namespace, **kwargs):
+    Classes missing from the index pass through for the handler to resolve, as
+    a create handler that is filtered out never sees the PVC again.
+    """
+    storage_class_name = spec.get('storageClassName')
+    if not storage_class_name:
+        return False
+    storage_class = _first(storage_class_index, storage_class_name)
+    return storage_class is None or storage_class['provisioner'] == PROVISIONER
+
+REFLINK_SCRIPT = '''
+#!/bin/bash
+set -e
+psql -h $PGHOST -p 5432 -U streaming_replica -d postgres -v ON_ERROR_STOP=1 -v TAG="$BACKUP_LABEL" <<EOF
+SELECT pg_backup_start('reflinker-' || :'TAG', true);
+\\! cp -a --reflink=always /source /dest/pgdata
+\\t
+\\a
+\\o /dest/pgdata/backup_label
+SELECT labelfile from pg_backup_stop(false);
+\\o
+EOF
+'''
+
+# Job manifests are built as plain dicts, which the client sends as-is,
+# rather than as trees of V1* models validated field by field.
+def populator_job(guid, namespace, node, source_pvc_name, pv_path, cluster_name, postgres_image, pod_ip):
+    """Build the Job that reflink-copies the source PVC into pv_path."""
+    return {
+        'apiVersion': 'batch/v1',
+        'kind': 'Job',
+        'metadata': {
+            'name': f'pg-reflinker-{guid}',
+            'namespace': namespace,
+            'labels': {'app.kubernetes.io/managed-by': 'pg-reflinker'},
+            'annotations': {'pg-reflinker/pv-guid': guid},
+        },
+        'spec': {
+            'template': {
+                'spec': {
+                    'nodeName': node,
+                    'restartPolicy': 'Never',
+                    'securityContext': {'fsGroup': 26},
+                    'initContainers': [
+                        {
+                            'name': 'init-permissions',
+                            'image': 'busybox:1.36',
+                            'command': ['sh', '-c', 'mkdir -p /dest && chown -R 26:26 /dest'],
+                            'securityContext': {'runAsUser': 0, 'runAsGroup': 0},
+                            'volumeMounts': [{'name': 'dest-data', 'mountPath': '/dest'}],
+                        }
+                    ],
+                    'volumes': [
+                        {
+                            'name': 'source-data',
+                            'persistentVolumeClaim': {'claimName': source_pvc_name, 'readOnly': True},
+                        },
+                        {
+                            'name': 'dest-data',
+                            'hostPath': {'path': pv_path},
+                        },
+                        {
+                            'name': 'replication-secret',
+                            'secret': {
+                                'secretName': f'{cluster_name}-replication',
+                                'defaultMode': 0o640,
+                                'items': [
+                                    {'key': 'tls.crt', 'path': 'tls.crt', 'mode': 0o640},
+                                    {'key': 'tls.key', 'path': 'tls.key', 'mode': 0o640},
+                                ],
+                            },
+                        },
+                        {
+                            'name': 'ca-secret',
+                            'secret': {'secretName': f'{cluster_name}-ca', 'defaultMode': 0o640},
+                        },
+                    ],
+                    'containers': [
+                        {
+                            'name': 'reflink-backup',
+                            'image': postgres_image,
+                            'securityContext': {'runAsUser': 26, 'runAsGroup': 26},
+                            'command': ['/bin/bash', '-c', REFLINK_SCRIPT],
+                            'env': [
+                                {'name': 'PGHOST', 'value': pod_ip},
+                                {'name': 'BACKUP_LABEL', 'value': guid},
+                                {'name': 'PGSSLMODE', 'value': 'verify-ca'},
+                                {'name': 'PGSSLCERT', 'value': '/secrets/replication/tls.crt'},
+                                {'name': 'PGSSLKEY', 'value': '/secrets/replication/tls.key'},
+                                {'name': 'PGSSLROOTCERT', 'value': '/secrets/ca/ca.crt'},
+                            ],
+                            'volumeMounts': [
+                                {'name': 'source-data', 'mountPath': '/source'},
+                                {'name': 'dest-data', 'mountPath': '/dest'},
+                                {'name': 'replication-secret', 'mountPath': '/secrets/replication'},
+                                {'name': 'ca-secret', 'mountPath': '/secrets/ca'},
+                            ],
+                        }
+                    ],
+                }
+            }
+        },
+    }
+
+def cleanup_job(guid, namespace, node, parent_path):
+    """Build the Job that removes the snapshot directory for guid."""
+    return {
+        'apiVersion': 'batch/v1',
+        'kind': 'Job',
+        'metadata': {
+            'name': f'pg-reflinker-cleanup-{guid}',
+            'namespace': namespace,
+            'labels': {'app.kubernetes.io/managed-by': 'pg-reflinker'},
+        },
+        'spec': {
+            'template': {
+                'spec': {
+                    'restartPolicy': 'Never',
+                    'nodeName': node,
+                    'volumes': [{'name': 'cleanup-data', 'hostPath': {'path': parent_path}}],
+                    'containers': [
+                        {
+                            'name': 'cleanup',
+                            'image': 'busybox:1.36',
+                            'command': ['sh', '-c', f'rm -rf /cleanup/{guid}'],
+                            'securityContext': {'runAsUser': 0, 'runAsGroup': 0},
+                            'volumeMounts': [{'name': 'cleanup-data', 'mountPath': '/cleanup'}],
+                        }
+                    ],
+                }
+            }
+        },
+    }
+
+@kopf.on.create('persistentvolumeclaim', when=is_reflinker_claim)
+async def handle_pvc_create(spec, meta, name, namespace, pvc_index, pvc_name_index, cluster_index, pod_index, secret_index,
+                            storage_class_index, **kwargs):
     """
     Handle creation of PVCs with storageClassName 'pg-reflinker'.
     """
 
-    # Get the storage class and check provisioner
-    storage_class_name = spec.get('storageClassName')
-    if not storage_class_name:
-        return  # No storage class specified
-    try:
-        storage_class = storage_v1.read_storage_class(storage_class_name)
-    except ApiException as e:
-        raise kopf.PermanentError(f"Failed to read storage class {storage_class_name}: {e}")
+    # Get the storage class; is_reflinker_claim has only ruled out classes
+    # already known to belong to another provisioner.
+    storage_class_name = spec['storageClassName']
+    storage_class = _first(storage_class_index, storage_class_name)
+    if storage_class is None:
+        try:
+            storage_class = await run_blocking(read_storage_class, storage_class_name)
+        except ApiException as e:
+            raise kopf.PermanentError(f"Failed to read storage class {storage_class_name}: {e}")
 
-    if storage_class.provisioner != 'k8s.insiderscore.com/pg-reflinker':
+    if storage_class['provisioner'] != PROVISIONER:
         return  # Not our concern
 
-    reclaim_policy = storage_class.reclaim_policy or 'Retain'
+    reclaim_policy = storage_class['reclaim_policy'] or 'Retain'
 
     # Extract dataSourceRef
     data_source = spec.get('dataSourceRef')
@@ -128,12 +497,14 @@ def handle_pvc_create(spec, meta, name, namespace, **kwargs):
     # Determine source namespace
     if 'namespace' in data_source:
         source_namespace = data_source['namespace']
-        try:
-            source_pvc = v1.read_namespaced_persistent_volume_claim(source_pvc_name, source_namespace)
-        except ApiException as e:
-            if e.status == 404:
-                raise kopf.PermanentError(f"Source PVC {source_pvc_name} not found in namespace {source_namespace}")
-            raise
+        source_pvc = _first(pvc_index, (source_namespace, source_pvc_name))
+        if source_pvc is None:
+            try:
+                source_pvc = await run_blocking(read_pvc, source_pvc_name, source_namespace)
+            except ApiException as e:
+                if e.status == 404:
+                    raise kopf.PermanentError(f"Source PVC {source_pvc_name} not found in namespace {source_namespace}")
+                raise
     else:
         # No namespace specified, try current namespace and NAMESPACE_PATH
         namespace_path = os.getenv('NAMESPACE_PATH', '')
@@ -141,77 +512,58 @@ def handle_pvc_create(spec, meta, name, namespace, **kwargs):
         if namespace_path:
             candidate_namespaces += [ns.strip() for ns in namespace_path.split(',') if ns.strip()]
 
+        # Earlier candidates take precedence when several namespaces match
+        found_namespaces = set(pvc_name_index.get(source_pvc_name, []))
+        source_namespace = next((ns for ns in candidate_namespaces if ns in found_namespaces), None)
         source_pvc = None
-        source_namespace = None
-        for ns in candidate_namespaces:
-            try:
-                source_pvc = v1.read_namespaced_persistent_volume_claim(source_pvc_name, ns)
-                source_namespace = ns
-                break
-            except ApiException as e:
-                if e.status != 404:
-                    raise  # Re-raise non-404 errors
+        if source_namespace is not None:
+            source_pvc = _first(pvc_index, (source_namespace, source_pvc_name))
+        if not source_pvc:
+            source_namespace, source_pvc = await run_blocking(find_pvc, source_pvc_name, candidate_namespaces)
         if not source_pvc:
             raise kopf.PermanentError(f"Source PVC {source_pvc_name} not found in any candidate namespace: {candidate_namespaces}")
 
     # Ensure the source PVC is bound before proceeding
-    if source_pvc.status.phase != 'Bound':
+    if source_pvc['phase'] != 'Bound':
         raise kopf.TemporaryError(f"Source PVC {source_pvc_name} in namespace {source_namespace} is not bound yet", delay=30)
 
     # Find the CNPG cluster from ownerReferences of the source PVC
-    owner_refs = source_pvc.metadata.owner_references or []
+    owner_refs = source_pvc['owner_references']
     cluster_name = None
     for ref in owner_refs:
-        if ref.kind == 'Cluster' and ref.api_version == 'postgresql.cnpg.io/v1':
-            cluster_name = ref.name
+        if ref.get('kind') == 'Cluster' and ref.get('apiVersion') == 'postgresql.cnpg.io/v1':
+            cluster_name = ref.get('name')
             break
 
     if not cluster_name:
         raise kopf.PermanentError("Source PVC must be owned by a CNPG Cluster")
 
-    # Get the PostgreSQL image from the CNPG cluster spec
-    try:
-        cluster = custom_api.get_namespaced_custom_object('postgresql.cnpg.io', 'v1', source_namespace, 'clusters', cluster_name)
-        postgres_image = cluster.get('spec', {}).get('imageName')
-    except ApiException as e:
-        raise kopf.PermanentError(f"Failed to get cluster {cluster_name}: {e}")
-    
-    if not postgres_image:
-        postgres_image = 'postgres:16'  # default fallback
-
-    # Get node affinity from the source PVC's bound PV
-    node_affinity = None
-    if source_pvc.spec.volume_name:
-        try:
-            source_pv = v1.read_persistent_volume(source_pvc.spec.volume_name)
-            node_affinity = source_pv.spec.node_affinity
-        except ApiException as e:
-            # Log but don't fail - node affinity is optional
-            pass
+    # The remaining lookups are independent; any that miss the indices are
+    # read from the apiserver concurrently.
+    postgres_image, node_affinity, _, pod = await asyncio.gather(
+        get_postgres_image(cluster_name, source_namespace, cluster_index),
+        get_node_affinity(source_pvc['volume_name']),
+        check_db_secrets(cluster_name, source_namespace, secret_index),
+        find_cnpg_pod(cluster_name, source_namespace, pod_index),
+    )
 
-    # Get CNPG pod and secrets
-    try:
-        pod = get_cnpg_pod(cluster_name, source_namespace)
-        replication_secret, ca_secret = get_db_secrets(cluster_name, source_namespace)
-    except Exception as e:
-        raise kopf.TemporaryError(f"Failed to get pod or secrets: {e}", delay=30)
-    
-    source_node = pod.spec.node_name
-    pod_ip = pod.status.pod_ip
+    source_node = pod['node_name']
+    pod_ip = pod['pod_ip']
 
     # Generate GUID for the snapshot - use PVC's UID for uniqueness
     guid = meta.get('uid', str(uuid.uuid4()))
     pv_name = f'pvc-{guid}'
-    pv_path = os.path.join(HOSTPATH_PREFIX, guid)
-
-    # Create the PV with local volume
-    pv = client.V1PersistentVolume(
-        api_version='v1',
-        kind='PersistentVolume',
-        metadata=client.V1ObjectMeta(
-            name=pv_name,
-            labels={'app.kubernetes.io/managed-by': 'pg-reflinker'},
-            annotations={
+    pv_path = str(HOSTPATH_PREFIX / guid)
+
+    # Create the PV with local volume. A plain dict skips the client's
+    # model construction and validation.
+    pv = {
+        'apiVersion': 'v1',
+        'kind': 'PersistentVolume',
+        'metadata': {
+            'name': pv_name,
+            'labels': {'app.kubernetes.io/managed-by': 'pg-reflinker'},
+            'annotations': {
                 'pg-reflinker/source-cluster': cluster_name,
                 'pg-reflinker/source-namespace': source_namespace,
                 'pg-reflinker/source-pvc': source_pvc_name,
@@ -220,138 +572,27 @@ def handle_pvc_create(spec, meta, name, namespace, **kwargs):
                 'pg-reflinker/claim-name': name,
                 'pg-reflinker/storage-class': storage_class_name,
                 'pg-reflinker/node': source_node,
-            }
-        ),
-        spec=client.V1PersistentVolumeSpec(
-            capacity={'storage': spec['resources']['requests']['storage']},
-            access_modes=['ReadWriteOnce'],
-            local=client.V1LocalVolumeSource(path=pv_path),
-            # storage_class_name not set initially to prevent premature binding
-            persistent_volume_reclaim_policy=reclaim_policy,
-            node_affinity=node_affinity,
-        )
-    )
-    v1.create_persistent_volume(pv)
+            },
+        },
+        'spec': {
+            'capacity': {'storage': spec['resources']['requests']['storage']},
+            'accessModes': ['ReadWriteOnce'],
+            'local': {'path': pv_path},
+            # storageClassName not set initially to prevent premature binding
+            'persistentVolumeReclaimPolicy': reclaim_policy,
+        },
+    }
+    if node_affinity:
+        pv['spec']['nodeAffinity'] = node_affinity
+    await pv_create_limiter.acquire()
+    await run_blocking(create_if_absent, v1.create_persistent_volume, pv)
 
     # Create the Job to perform the reflink backup
-    job_name = f'pg-reflinker-{guid}'
-    script = f'''
-#!/bin/bash
-set -e
-psql -h $PGHOST -p 5432 -U streaming_replica -d postgres -v ON_ERROR_STOP=1 -v TAG="$BACKUP_LABEL" <<EOF
-SELECT pg_backup_start('reflinker-' || :'TAG', true);
-\\! cp -a --reflink=always /source /dest/pgdata
-\\t
-\\a
-\\o /dest/pgdata/backup_label
-SELECT labelfile from pg_backup_stop(false);
-\\o
-EOF
-'''
-    job = client.V1Job(
-        api_version='batch/v1',
-        kind='Job',
-        metadata=client.V1ObjectMeta(
-            name=job_name,
-            namespace=source_namespace,
-            labels={'app.kubernetes.io/managed-by': 'pg-reflinker'},
-            annotations={'pg-reflinker/pv-guid': guid}
-        ),
-        spec=client.V1JobSpec(
-            template=client.V1PodTemplateSpec(
-                spec=client.V1PodSpec(
-                    node_name=source_node,
-                    restart_policy='Never',
-                    security_context=client.V1PodSecurityContext(fs_group=26),
-                    init_containers=[
-                        client.V1Container(
-                            name='init-permissions',
-                            image='busybox:1.36',
-                            command=['sh', '-c', 'mkdir -p /dest && chown -R 26:26 /dest'],
-                            security_context=client.V1SecurityContext(run_as_user=0, run_as_group=0),
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name='dest-data',
-                                    mount_path='/dest'
-                                )
-                            ]
-                        )
-                    ],
-                    volumes=[
-                        client.V1Volume(
-                            name='source-data',
-                            persistent_volume_claim=client.V1PersistentVolumeClaimVolumeSource(
-                                claim_name=source_pvc_name,
-                                read_only=True
-                            )
-                        ),
-                        client.V1Volume(
-                            name='dest-data',
-                            host_path=client.V1HostPathVolumeSource(
-                                path=pv_path
-                            )
-                        ),
-                        client.V1Volume(
-                            name='replication-secret',
-                            secret=client.V1SecretVolumeSource(
-                                secret_name=f'{cluster_name}-replication',
-                                default_mode=0o640,
-                                items=[
-                                    client.V1KeyToPath(key='tls.crt', path='tls.crt', mode=0o640),
-                                    client.V1KeyToPath(key='tls.key', path='tls.key', mode=0o640)
-                                ]
-                            )
-                        ),
-                        client.V1Volume(
-                            name='ca-secret',
-                            secret=client.V1SecretVolumeSource(
-                                secret_name=f'{cluster_name}-ca',
-                                default_mode=0o640
-                            )
-                        )
-                    ],
-                    containers=[
-                        client.V1Container(
-                            name='reflink-backup',
-                            image=postgres_image,
-                            security_context=client.V1SecurityContext(run_as_user=26, run_as_group=26),
-                            command=['/bin/bash', '-c', script],
-                            env=[
-                                client.V1EnvVar(name='PGHOST', value=pod_ip),
-                                client.V1EnvVar(name='BACKUP_LABEL', value=guid),
-                                client.V1EnvVar(name='PGSSLMODE', value='verify-ca'),
-                                client.V1EnvVar(name='PGSSLCERT', value='/secrets/replication/tls.crt'),
-                                client.V1EnvVar(name='PGSSLKEY', value='/secrets/replication/tls.key'),
-                                client.V1EnvVar(name='PGSSLROOTCERT', value='/secrets/ca/ca.crt')
-                            ],
-                            volume_mounts=[
-                                client.V1VolumeMount(
-                                    name='source-data',
-                                    mount_path='/source'
-                                ),
-                                client.V1VolumeMount(
-                                    name='dest-data',
-                                    mount_path='/dest'
-                                ),
-                                client.V1VolumeMount(
-                                    name='replication-secret',
-                                    mount_path='/secrets/replication'
-                                ),
-                                client.V1VolumeMount(
-                                    name='ca-secret',
-                                    mount_path='/secrets/ca'
-                                )
-                            ]
-                        )
-                    ]
-                )
-            )
-        )
-    )
-    batch_v1.create_namespaced_job(source_namespace, job)
+    job = populator_job(guid, source_namespace, source_node, source_pvc_name, pv_path, cluster_name, postgres_image, pod_ip)
+    await run_blocking(create_if_absent, batch_v1.create_namespaced_job, source_namespace, job)
 
 @kopf.on.field('batch', 'v1', 'jobs', field='status.succeeded', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'})
-def handle_job_succeeded(old, new, name, namespace, logger, **kwargs):
+def handle_job_succeeded(old, new, name, namespace, logger, pvc_index, **kwargs):
     """
     Handle successful completion of the populator job by binding the PV to the PVC.
     """
@@ -359,42 +600,45 @@ def handle_job_succeeded(old, new, name, namespace, logger, **kwargs):
         guid = name.replace('pg-reflinker-', '')
         pv_name = f'pvc-{guid}'
         try:
-            # Retrieve the PersistentVolume
-            pv: client.V1PersistentVolume = v1.read_persistent_volume(pv_name)
-
-            if not pv.spec:
-                raise kopf.PermanentError(f"PersistentVolume {pv_name} is missing spec.")
+            # Retrieve the PersistentVolume's annotations as raw JSON
+            response = v1.read_persistent_volume(pv_name, _preload_content=False)
+            annotations = json.loads(response.data).get('metadata', {}).get('annotations')
 
             # Ensure metadata and annotations exist
-            if not pv.metadata or not pv.metadata.annotations:
+            if not annotations:
                 raise kopf.PermanentError(f"PersistentVolume {pv_name} is missing metadata or annotations.")
 
             # Update the storage class and claim reference
-            storage_class = pv.metadata.annotations.get('pg-reflinker/storage-class')
-            claim_name = pv.metadata.annotations.get('pg-reflinker/claim-name')
-            claim_namespace = pv.metadata.annotations.get('pg-reflinker/claim-namespace')
+            storage_class = annotations.get('pg-reflinker/storage-class')
+            claim_name = annotations.get('pg-reflinker/claim-name')
+            claim_namespace = annotations.get('pg-reflinker/claim-namespace')
 
             if not storage_class or not claim_name or not claim_namespace:
                 raise kopf.PermanentError(
                     f"PersistentVolume {pv_name} is missing required annotations for binding."
                 )
             
-            # Retrieve the PVC to get its UID for the claimRef
-            try:
-                pvc: client.V1PersistentVolumeClaim = v1.read_namespaced_persistent_volume_claim(claim_name, claim_namespace)
-            except ApiException as e:
-                raise kopf.PermanentError(f"Failed to retrieve PVC {claim_namespace}/{claim_name}: {e}")
-
-            pv.spec.storage_class_name = storage_class
-            pv.spec.claim_ref = client.V1ObjectReference(
-                kind='PersistentVolumeClaim',
-                name=claim_name,
-                namespace=claim_namespace,
-                uid=pvc.metadata.uid
-            )
-
-            # Replace the PersistentVolume with updated details
-            v1.replace_persistent_volume(pv_name, pv)
+            # Look up the PVC's UID for the claimRef
+            pvc = _first(pvc_index, (claim_namespace, claim_name))
+            if pvc is not None:
+                claim_uid = pvc['uid']
+            else:
+                try:
+                    claim_uid = read_pvc(claim_name, claim_namespace)['uid']
+                except ApiException as e:
+                    raise kopf.PermanentError(f"Failed to retrieve PVC {claim_namespace}/{claim_name}: {e}")
+
+            # Patch only the binding fields rather than sending the whole PV back
+            patch = {'spec': {
+                'storageClassName': storage_class,
+                'claimRef': {
+                    'kind': 'PersistentVolumeClaim',
+                    'name': claim_name,
+                    'namespace': claim_namespace,
+                    'uid': claim_uid,
+                },
+            }}
+            call_discarding(v1.patch_persistent_volume, pv_name, patch)
 
             # Log success
             logger.info(
@@ -410,155 +654,67 @@ def handle_job_succeeded(old, new, name, namespace, logger, **kwargs):
             raise
 
 @kopf.on.field('batch', 'v1', 'jobs', field='status.failed', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'})
-def handle_job_failed(old, new, name, namespace, logger, **kwargs):
+async def handle_job_failed(old, new, name, namespace, logger, **kwargs):
+    """
+    Handle failure of the populator job by deleting its PV.
+    """
     if not old and new == 1:
         logger.warning(f"Job {name} in namespace {namespace} failed. Cleaning up resources.")
         guid = name.replace('pg-reflinker-', '')
-        pv_name = f'pvc-{guid}'
-        try:
-            v1.delete_persistent_volume(pv_name)
-            logger.info(f"Cleaned up PersistentVolume {pv_name} due to job failure.")
-        except ApiException as e:
-            if e.status == 404:
-                logger.info(f"PersistentVolume {pv_name} already deleted.")
-            else:
-                logger.error(f"Failed to delete PersistentVolume {pv_name}: {e}")
+        enqueue_pv_delete(f'pvc-{guid}', logger)
 
-@kopf.on.delete('persistentvolume', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'})
-def handle_pv_delete(name, logger, **kwargs):
-    """
-    Handle deletion of PVs managed by pg-reflinker to clean up local directories.
-    """
-    # Get PV info from kwargs
-    pv = kwargs.get('body', {})
-    spec = pv.get('spec', {})
-    reclaim_policy = spec.get('persistentVolumeReclaimPolicy', 'Retain')
-    annotations = pv.get('metadata', {}).get('annotations', {})
-    
-    guid = annotations.get('pg-reflinker/source-backup-label')
-    if not guid:
-        logger.warning(f"PV {name} is missing the source-backup-label annotation. Cannot clean up.")
-        return
-    
-    parent_path = HOSTPATH_PREFIX
-    
-    if reclaim_policy == 'Delete':
-        # For 'Delete' policy, we need to remove the directory from the host path
-        # This requires running a privileged pod on the correct node.
-        # For simplicity in this example, we will log the action.
-        # A real implementation would create a cleanup job/pod.
-        logger.info(f"PV {name} with reclaim policy 'Delete'. Manual cleanup of path may be required.")
-        
-
-@kopf.on.field('persistentvolume', field='status.phase', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'})
-def on_pv_phase_change(old, new, name, **kwargs):
+@kopf.on.delete('persistentvolume', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'},
+                annotations={'pg-reflinker/source-backup-label': kopf.PRESENT},
+                field='spec.persistentVolumeReclaimPolicy', value='Delete')
+def handle_pv_delete(name, annotations, **kwargs):
     """
-    When a PV becomes Released, if the reclaim policy is Retain, we should
-    clean up the hostPath directory.
+    Handle deletion of PVs managed by pg-reflinker with reclaim policy
+    'Delete' by running a Job that removes the local directory.
     """
-    if new == 'Released':
-        pv = v1.read_persistent_volume(name)
-        if pv.spec.persistent_volume_reclaim_policy == 'Retain':
-            # Similar to the delete handler, this would require a cleanup job.
-            # For now, we just log it.
-            pass
-
-@kopf.on.update('batch', 'v1', 'jobs', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'}, field='status.conditions')
-def handle_job_failed(status, name, namespace, logger, **kwargs):
-    conditions = status.get('conditions', [])
-    for cond in conditions:
-        if cond.get('type') == 'Failed' and cond.get('status') == 'True':
-            logger.warning(f"Job {name} in namespace {namespace} failed. Cleaning up resources.")
-            guid = name.split('-')[-1]
-            pv_name = f'pvc-{guid}'
-            try:
-                v1.delete_persistent_volume(pv_name)
-                logger.info(f"Cleaned up PersistentVolume {pv_name} due to job failure.")
-            except ApiException as e:
-                if e.status == 404:
-                    logger.info(f"PersistentVolume {pv_name} already deleted.")
-                else:
-                    logger.error(f"Failed to delete PersistentVolume {pv_name}: {e}")
-            breakguid = name.split('-')[-1]
-            pv_name = f'pvc-{guid}'
-            try:
-                v1.delete_persistent_volume(pv_name)
-            except ApiException:
-                pass
-            break
+    guid = annotations['pg-reflinker/source-backup-label']
+    parent_path = str(HOSTPATH_PREFIX)
 
-@kopf.on.delete('persistentvolume', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'})
-def handle_pv_delete(name, **kwargs):
-    """
-    Handle deletion of PVs managed by pg-reflinker to clean up local directories.
-    """
-    # Get PV info from kwargs
-    pv = kwargs.get('body', {})
-    spec = pv.get('spec', {})
-    reclaim_policy = spec.get('persistentVolumeReclaimPolicy', 'Retain')
-    annotations = pv.get('metadata', {}).get('annotations', {})
-    
-    guid = annotations.get('pg-reflinker/source-backup-label')
-    if not guid:
-        return
-    
-    parent_path = HOSTPATH_PREFIX
-    
-    if reclaim_policy == 'Delete':
-        # Create a cleanup Job to delete the local directory
-        job_name = f'pg-reflinker-cleanup-{guid}'
-        node = annotations.get('pg-reflinker/node')
-        cleanup_namespace = annotations.get('pg-reflinker/source-namespace', 'default')
-        
-        job = client.V1Job(
-            api_version='batch/v1',
-            kind='Job',
-            metadata=client.V1ObjectMeta(
-                name=job_name,
-                namespace=cleanup_namespace,
-                labels={'app.kubernetes.io/managed-by': 'pg-reflinker'}
-            ),
-            spec=client.V1JobSpec(
-                template=client.V1PodTemplateSpec(
-                    spec=client.V1PodSpec(
-                        restart_policy='Never',
-                        node_name=node,
-                        volumes=[
-                            client.V1Volume(
-                                name='cleanup-data',
-                                host_path=client.V1HostPathVolumeSource(path=parent_path)
-                            )
-                        ],
-                        containers=[
-                            client.V1Container(
-                                name='cleanup',
-                                image='busybox:1.36',
-                                command=['sh', '-c', f'rm -rf /cleanup/{guid}'],
-                                security_context=client.V1SecurityContext(run_as_user=0, run_as_group=0),
-                                volume_mounts=[
-                                    client.V1VolumeMount(
-                                        name='cleanup-data',
-                                        mount_path='/cleanup'
-                                    )
-                                ]
-                            )
-                        ]
-                    )
-                )
-            )
-        )
-        batch_v1.create_namespaced_job(cleanup_namespace, job)
+    # Create a cleanup Job to delete the local directory
+    node = annotations.get('pg-reflinker/node')
+    cleanup_namespace = annotations.get('pg-reflinker/source-namespace', 'default')
+    job = cleanup_job(guid, cleanup_namespace, node, parent_path)
+    create_if_absent(batch_v1.create_namespaced_job, cleanup_namespace, job)
 
-@kopf.on.update('persistentvolume', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'}, field='status.phase')
-def handle_pv_failed(old, new, **kwargs):
+@kopf.on.update('persistentvolume', labels={'app.kubernetes.io/managed-by': 'pg-reflinker'}, field='status.phase', new='Failed')
+async def handle_pv_failed(name, meta, logger, **kwargs):
     """
     Handle PVs that enter Failed phase by auto-deleting them for cleanup.
     """
-    if new == 'Failed':
-        # Get the PV object from kwargs
-        pv = kwargs['body']
-        name = pv['metadata']['name']
-        v1.delete_persistent_volume(name)
+    if meta.get('deletionTimestamp'):
+        return  # Already being deleted
+    enqueue_pv_delete(name, logger)
+
+@kopf.on.startup()
+async def configure(settings: kopf.OperatorSettings, **kwargs):
+    """Size kopf for bursts of PVC reconciles bound by apiserver and Job I/O."""
+    settings.execution.max_workers = int(os.getenv('MAX_WORKERS', '32'))
+    settings.networking.request_timeout = 30
+    settings.watching.server_timeout = 600
+    settings.queueing.idle_timeout = 1.0
+    # Let run_blocking share the same executor as kopf's sync handlers
+    asyncio.get_running_loop().set_default_executor(settings.execution.executor)
+
+@kopf.on.startup()
+async def start_pv_delete_worker(logger, **kwargs):
+    """Create the PV delete queue on kopf's loop and start draining it."""
+    global _pv_delete_queue
+    _pv_delete_queue = asyncio.Queue()
+    task = asyncio.create_task(drain_pv_deletes(logger))
+    _pv_delete_tasks.add(task)
+
+@kopf.on.cleanup()
+async def stop_pv_delete_worker(**kwargs):
+    """Cancel the PV delete worker, deletes still in flight and pending retries."""
+    for task in list(_pv_delete_tasks):
+        task.cancel()
+    for handle in _pv_delete_retries.values():
+        handle.cancel()
+    _pv_delete_retries.clear()
 
 def main():
     kopf.run(namespace=None)